@@ -1,5 +1,106 @@
-import configparser
+import functools
+import os
+import re
+import sys
 from os import environ
+from types import MappingProxyType
+from typing import Mapping
+
+# Matches "%%" and "%(name)s", as handled by configparser.BasicInterpolation
+_INTERPOLATION = re.compile(r"%(?:%|\((?P<name>[^)]+)\)s)")
+_MAX_INTERPOLATION_DEPTH = 10
+# Same section header pattern as configparser.RawConfigParser.SECTCRE
+_SECTION_HEADER = re.compile(r"\[(?P<header>.+)\]")
+
+
+def _interpolate(value: str, options: Mapping[str, str], depth: int = 0) -> str:
+    """Expand %(name)s references to other options of the same section."""
+
+    def replace(match: re.Match[str]) -> str:
+        name = match.group("name")
+        if name is None:
+            return "%"
+        name = name.lower()
+        if name not in options or depth >= _MAX_INTERPOLATION_DEPTH:
+            return match.group(0)
+        return _interpolate(options[name], options, depth + 1)
+
+    return _INTERPOLATION.sub(replace, value)
+
+
+def _parse_ini(path: str) -> dict[str, str]:
+    """Parse an INI file into a section_key -> value dict.
+
+    Covers the configparser syntax used by our configuration files:
+    [section] headers, "key = value" and "key: value" lines, full line
+    "#" and ";" comments, continuation lines indented deeper than their
+    key (blank lines inside them are kept), a [DEFAULT] section whose keys
+    apply to every section, and %(key)s interpolation. Keys are lowercased
+    like configparser does.
+    """
+    defaults: dict[str, list[str]] = {}
+    sections: dict[str, dict[str, list[str]]] = {}
+    current: dict[str, list[str]] | None = None
+    key: str | None = None
+    key_indent = 0
+
+    with open(path) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped[:1] in ("#", ";"):
+                continue
+            if not stripped:
+                # Kept only if a continuation line follows, see the join below
+                if current is not None and key is not None:
+                    current[key].append("")
+                continue
+
+            indent = len(line) - len(line.lstrip())
+            if current is not None and key is not None and indent > key_indent:
+                current[key].append(stripped)
+                continue
+            key_indent = indent
+
+            header = _SECTION_HEADER.match(stripped)
+            if header:
+                name = header.group("header")
+                if name == "DEFAULT":
+                    current = defaults
+                else:
+                    current = sections.setdefault(name, {})
+                key = None
+                continue
+
+            delimiters = [i for i in (stripped.find("="), stripped.find(":")) if i > 0]
+            if current is None or not delimiters:
+                key = None
+                continue
+            pos = min(delimiters)
+            key = stripped[:pos].rstrip().lower()
+            current[key] = [stripped[pos + 1 :].lstrip()]
+
+    attributes = {}
+    for section, lines in sections.items():
+        options = {
+            option: "\n".join(parts).rstrip()
+            for option, parts in {**defaults, **lines}.items()
+        }
+        for option, value in options.items():
+            # Interned like attribute names in compiled code, so lookups can
+            # match on identity
+            attr_name = sys.intern(f"{section.lower()}_{option}")
+            attributes[attr_name] = _interpolate(value, options)
+    return attributes
+
+
+@functools.lru_cache(maxsize=None)
+def _load_attrs(config_file: str, mtime_ns: int) -> Mapping[str, str]:
+    """Parse config_file into a read-only section_key -> value mapping.
+
+    mtime_ns is only part of the cache key, so an edited file is re-parsed
+    while an unchanged one is parsed once per process.
+    """
+    return MappingProxyType(_parse_ini(config_file))
 
 
 class MyConfig:
@@ -17,25 +118,40 @@ class MyConfig:
 
     config = MyConfig(<env_var>)
     print(config.section_key)
+
+    The parsed file is cached per process and only re-read when its
+    modification time changes.
     """
 
-    def __init__(self, env_var: str) -> None:
-        self._config = configparser.ConfigParser()
+    # The parsed values live in the instance __dict__; keep the mapping
+    # itself in a slot so it stays out of vars(config). __weakref__ keeps
+    # instances weak-referenceable.
+    __slots__ = ("_attributes", "__dict__", "__weakref__")
 
+    _attributes: Mapping[str, str]
+
+    def __init__(self, env_var: str) -> None:
         if env_var not in environ:
             raise ValueError(f"Environment variable {env_var} not set")
         config_file = str(environ.get(env_var))
-        self._config.read(config_file)
-        self._attributes = {}
 
-        for section in self._config.sections():
-            for key, value in self._config.items(section):
-                attr_name = f"{section.lower()}_{key}"
-                self._attributes[attr_name] = value
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            self._attributes = _load_attrs(config_file, mtime_ns)
+        except OSError:
+            # A missing or unreadable file gives an empty config, like
+            # configparser.read()
+            self._attributes = MappingProxyType({})
+            return
+        # Bind the values as real attributes so lookups never reach
+        # __getattr__
+        self.__dict__.update(self._attributes)
 
     def __getattr__(self, name: str) -> str:
-        if name in self._attributes:
+        # Only called for names that are not bound on the instance
+        try:
             return self._attributes[name]
-        raise AttributeError(
-            f"'{self.__class__.__name__}' object has no attribute '{name}'"
-        )
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            ) from None
@@ -1,8 +1,63 @@
 """Setup a nice logger"""
 
+import functools
 import logging
-
-import colorlog  # type: ignore
+from types import ModuleType
+
+# colorlog is imported on first use so importing this module stays cheap
+_colorlog: ModuleType | None = None
+
+
+def _import_colorlog() -> ModuleType:
+    """Return the colorlog module, importing it on the first call."""
+    global _colorlog
+    if _colorlog is None:
+        import colorlog  # type: ignore
+
+        _colorlog = colorlog
+    return _colorlog
+
+
+@functools.lru_cache(maxsize=8)
+def _make_color_formatter(add_timestamp: bool, debug: bool) -> logging.Formatter:
+    """Build the color formatter for one (add_timestamp, debug) combination.
+
+    Formatters hold no per-logger state, so one instance per combination is
+    shared by every logger set up with it.
+    """
+    # Define the log format
+    if add_timestamp:
+        # Include timestamp at the beginning
+        format_prefix = "%(asctime)s "
+        datefmt = "%Y-%m-%d %H:%M:%S"
+    else:
+        format_prefix = ""
+        datefmt = None
+
+    # Create a color formatter (console)
+    if debug:
+        text = (
+            format_prefix + "%(log_color)s%(name)s(%(filename)s:%(lineno)d) - "
+            "%(levelname)s: %(message)s"
+        )
+    else:
+        text = format_prefix + "%(log_color)s%(levelname)s: %(message)s"
+
+    colorlog = _import_colorlog()
+    formatter: logging.Formatter = colorlog.ColoredFormatter(
+        text,
+        datefmt=datefmt,
+        log_colors={
+            "DEBUG": "reset",
+            "INFO": "green",
+            "WARNING": "yellow",
+            "ERROR": "red",
+            "CRITICAL": "bold_red",
+        },
+        secondary_log_colors={},
+        style="%",
+    )
+    return formatter
 
 
 class MyLogger:
@@ -55,37 +110,7 @@ class MyLogger:
         if logger.hasHandlers():
             logger.handlers.clear()
 
-        # Define the log format
-        if self.add_timestamp:
-            # Include timestamp at the beginning
-            format_prefix = "%(asctime)s "
-            datefmt = "%Y-%m-%d %H:%M:%S"
-        else:
-            format_prefix = ""
-            datefmt = None
-
-        # Create a color formatter (console)
-        if level == logging.DEBUG:
-            text = (
-                format_prefix + "%(log_color)s%(name)s(%(filename)s:%(lineno)d) - "
-                "%(levelname)s: %(message)s"
-            )
-        else:
-            text = format_prefix + "%(log_color)s%(levelname)s: %(message)s"
-
-        formatter = colorlog.ColoredFormatter(
-            text,
-            datefmt=datefmt,
-            log_colors={
-                "DEBUG": "reset",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "bold_red",
-            },
-            secondary_log_colors={},
-            style="%",
-        )
+        formatter = _make_color_formatter(self.add_timestamp, level == logging.DEBUG)
 
         # Create and configure console handler
         console_handler = logging.StreamHandler()
@@ -6,12 +6,36 @@ It can also be installed as a command line tool to send messages from the termin
 Install with `pipx install .` and use with `pushover_message <message>`. In case of
 running the script from the cli PUSHOVER_APP_TOKEN and PUSHOVER_USER_KEY environment
 variables must be set.
+
+Several messages can be sent concurrently with PushoverMessage.send_many(), or
+from asyncio code with PushoverMessage.send_async(). Both need the optional
+aiohttp dependency, install with `pip install .[async]`.
 """
 
+import asyncio
 import http.client
 import os
 import sys
+import threading
 import urllib.parse
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import aiohttp
+
+MESSAGES_URL = "https://api.pushover.net/1/messages.json"
+
+
+def _import_aiohttp() -> ModuleType:
+    """Return the aiohttp module, which is only needed for async sends."""
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "aiohttp is required for async sends: pip install aiohttp"
+        ) from e
+    return aiohttp
 
 
 class PushoverMessage:
@@ -26,25 +50,103 @@ class PushoverMessage:
     def __init__(self, app_token: str, user_key: str) -> None:
         self._app_token = app_token
         self._user_key = user_key
+        # token and user never change, so only the message is encoded per send
+        self._body_prefix = (
+            f"token={urllib.parse.quote_plus(app_token)}"
+            f"&user={urllib.parse.quote_plus(user_key)}&message="
+        )
+        self._conn: http.client.HTTPSConnection | None = None
+        self._lock = threading.Lock()
 
     def send(self, message: str) -> None:
         """
         Send a message to the pushover server.
+
+        The HTTPS connection is kept open and reused by later calls. If the
+        server has closed a reused connection before answering, the message
+        is sent once more on a fresh connection. Concurrent calls from
+        several threads are serialized on the shared connection.
         """
-        conn = http.client.HTTPSConnection("api.pushover.net:443")
-        conn.request(
-            "POST",
-            "/1/messages.json",
-            urllib.parse.urlencode(
-                {
-                    "token": self._app_token,
-                    "user": self._user_key,
-                    "message": message,
-                }
-            ),
-            {"Content-type": "application/x-www-form-urlencoded"},
-        )
-        conn.getresponse()
+        with self._lock:
+            reused = self._conn is not None
+            try:
+                response = self._request(message)
+            except (BrokenPipeError, ConnectionResetError):
+                # Raised before any response arrived (RemoteDisconnected is a
+                # ConnectionResetError), so the server dropped the idle
+                # connection and did not get the message
+                if not reused:
+                    raise
+                response = self._request(message)
+            try:
+                # The body must be read before the connection can be reused
+                response.read()
+            except (http.client.HTTPException, OSError):
+                self._drop_conn()
+                raise
+
+    async def send_async(
+        self, message: str, session: "aiohttp.ClientSession | None" = None
+    ) -> None:
+        """
+        Send a message to the pushover server without blocking the event loop.
+
+        Pass a shared aiohttp session to pool connections between sends,
+        otherwise a session is created for this message only.
+        """
+        if session is None:
+            aiohttp = _import_aiohttp()
+            async with aiohttp.ClientSession() as own_session:
+                await self.send_async(message, own_session)
+            return
+        async with session.post(
+            MESSAGES_URL,
+            data=self._encode(message),
+            headers={"Content-type": "application/x-www-form-urlencoded"},
+        ) as response:
+            await response.read()
+
+    def send_many(self, messages: Iterable[str]) -> None:
+        """
+        Send several messages to the pushover server concurrently.
+        """
+        asyncio.run(self._send_many(messages))
+
+    async def _send_many(self, messages: Iterable[str]) -> None:
+        aiohttp = _import_aiohttp()
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(self.send_async(m, session) for m in messages))
+
+    def close(self) -> None:
+        """
+        Close the cached connection to the pushover server, if any.
+        """
+        with self._lock:
+            self._drop_conn()
+
+    def _drop_conn(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _encode(self, message: str) -> str:
+        return self._body_prefix + urllib.parse.quote_plus(message)
+
+    def _request(self, message: str) -> http.client.HTTPResponse:
+        """Send the POST request and wait for the response headers."""
+        if self._conn is None:
+            self._conn = http.client.HTTPSConnection("api.pushover.net:443")
+        try:
+            self._conn.request(
+                "POST",
+                "/1/messages.json",
+                self._encode(message),
+                {"Content-type": "application/x-www-form-urlencoded"},
+            )
+            return self._conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            self._drop_conn()
+            raise
 
 
 def main() -> None:
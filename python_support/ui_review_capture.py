@@ -2,20 +2,29 @@
 
 Captures screenshots at multiple viewports and runs Lighthouse audits
 for use by the ui-reviewer Claude Code subagent. Install with
-``pipx install .`` and use with ``ui-review-capture <url>``.
+``pipx install .`` and use with ``ui-review-capture <url>``. Installing
+the optional ``ui-review`` extra (ijson) lets large Lighthouse reports be
+streamed instead of loaded whole.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import json
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import Any
 
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
 DEFAULT_VIEWPORTS: list[tuple[int, int]] = [
@@ -24,8 +33,37 @@ DEFAULT_VIEWPORTS: list[tuple[int, int]] = [
     (375, 812),
 ]
 
+# Upper bound on a Lighthouse run before its process group is killed
+LIGHTHOUSE_TIMEOUT_S = 120
+
+# Upper bound on waiting for web fonts before a screenshot is taken
+FONT_WAIT_TIMEOUT_MS = 2_000
+
+LIGHTHOUSE_CATEGORIES: tuple[str, ...] = (
+    "performance",
+    "accessibility",
+    "best-practices",
+    "seo",
+)
+
 PROFILE_DIR: Path = Path.home() / ".local" / "share" / "ui-review-capture" / "profile"
 
+# Profile directories already known to exist. Only positive results are
+# cached, so a profile created later by --login is still picked up.
+_READY_PROFILES: set[Path] = set()
+
+
+def _profile_ready(profile_dir: Path, create: bool = False) -> bool:
+    """Return True if *profile_dir* exists, creating it first if *create*."""
+    if profile_dir in _READY_PROFILES:
+        return True
+    if create:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+    if not profile_dir.is_dir():
+        return False
+    _READY_PROFILES.add(profile_dir)
+    return True
+
 
 def login_interactive(
     url: str,
@@ -38,7 +76,7 @@ def login_interactive(
     The session is persisted to *profile_dir* so subsequent headless runs
     can access authenticated pages.
     """
-    profile_dir.mkdir(parents=True, exist_ok=True)
+    _profile_ready(profile_dir, create=True)
     with sync_playwright() as pw:
         launcher = getattr(pw, browser_type)
         context = launcher.launch_persistent_context(
@@ -62,72 +100,138 @@ def capture_screenshots(
     browser_type: str = "firefox",
     ignore_ssl: bool = False,
     profile_dir: Path | None = None,
+    image_type: str = "png",
 ) -> list[Path]:
     """Take full-page screenshots at each viewport size.
 
     When *profile_dir* is given, uses a persistent context that shares
-    cookies/localStorage from a previous ``--login`` session.
+    cookies/localStorage from a previous ``--login`` session, with one page
+    per viewport. Otherwise every viewport gets its own clean context. All
+    pages are loaded and captured concurrently.
+
+    *image_type* is ``"png"`` or ``"jpeg"``; JPEG files are much smaller
+    and faster to encode when pixel-exact output is not needed.
 
-    Returns the list of saved screenshot paths.
+    Returns the list of saved screenshot paths, in *viewports* order.
     """
-    paths: list[Path] = []
-    with sync_playwright() as pw:
+    return asyncio.run(
+        _capture_screenshots_async(
+            url,
+            viewports,
+            output_dir,
+            browser_type,
+            ignore_ssl,
+            profile_dir,
+            image_type,
+        )
+    )
+
+
+async def _capture_screenshots_async(
+    url: str,
+    viewports: list[tuple[int, int]],
+    output_dir: Path,
+    browser_type: str,
+    ignore_ssl: bool,
+    profile_dir: Path | None,
+    image_type: str,
+) -> list[Path]:
+    """Async implementation of :func:`capture_screenshots`."""
+    options: dict[str, Any] = {"full_page": True, "type": image_type}
+    if image_type == "jpeg":
+        options["quality"] = 85
+    extension = "jpg" if image_type == "jpeg" else "png"
+
+    async with async_playwright() as pw:
         launcher = getattr(pw, browser_type)
 
-        if profile_dir and profile_dir.is_dir():
-            # Persistent context — reuses login session
-            context = launcher.launch_persistent_context(
+        browser = None
+        if profile_dir and _profile_ready(profile_dir):
+            # Persistent context — reuses login session, which only supports
+            # one context, so every viewport gets a page in it
+            context = await launcher.launch_persistent_context(
                 str(profile_dir),
                 headless=True,
-                viewport={"width": viewports[0][0], "height": viewports[0][1]},
                 device_scale_factor=1,
                 ignore_https_errors=ignore_ssl,
             )
-            page = context.pages[0] if context.pages else context.new_page()
-            page.goto(url, wait_until="networkidle", timeout=30_000)
-            page.wait_for_timeout(500)
-
-            dest = output_dir / f"screenshot-{viewports[0][0]}x{viewports[0][1]}.png"
-            page.screenshot(path=str(dest), full_page=True)
-            paths.append(dest)
-
-            # Remaining viewports — resize the same page
-            for width, height in viewports[1:]:
-                page.set_viewport_size({"width": width, "height": height})
-                page.goto(url, wait_until="networkidle", timeout=30_000)
-                page.wait_for_timeout(500)
-                dest = output_dir / f"screenshot-{width}x{height}.png"
-                page.screenshot(path=str(dest), full_page=True)
-                paths.append(dest)
-
-            context.close()
+            contexts = [context]
+            pages = [await context.new_page() for _ in viewports]
         else:
-            # Ephemeral contexts — no saved session
-            browser = launcher.launch(headless=True)
-            for width, height in viewports:
-                context = browser.new_context(
-                    viewport={"width": width, "height": height},
-                    device_scale_factor=1,
-                    ignore_https_errors=ignore_ssl,
+            # Ephemeral contexts — no saved session, and one clean context
+            # per viewport so concurrent loads don't share cookies or storage
+            browser = await launcher.launch(headless=True)
+            contexts = list(
+                await asyncio.gather(
+                    *(
+                        browser.new_context(
+                            device_scale_factor=1,
+                            ignore_https_errors=ignore_ssl,
+                        )
+                        for _ in viewports
+                    )
                 )
-                page = context.new_page()
-                page.goto(url, wait_until="networkidle", timeout=30_000)
-                page.wait_for_timeout(500)
+            )
+            pages = [await context.new_page() for context in contexts]
+
+        try:
+            paths = await asyncio.gather(
+                *(
+                    _capture_viewport(
+                        page,
+                        url,
+                        (width, height),
+                        output_dir / f"screenshot-{width}x{height}.{extension}",
+                        options,
+                    )
+                    for page, (width, height) in zip(pages, viewports)
+                )
+            )
+        finally:
+            for context in contexts:
+                await context.close()
+            if browser is not None:
+                await browser.close()
+    return list(paths)
+
+
+async def _capture_viewport(
+    page: Page,
+    url: str,
+    viewport: tuple[int, int],
+    dest: Path,
+    options: dict[str, Any],
+) -> Path:
+    """Load *url* in *page* sized to *viewport* and save a screenshot."""
+    width, height = viewport
+    await page.set_viewport_size({"width": width, "height": height})
+    await page.goto(url, wait_until="networkidle", timeout=30_000)
+    # networkidle already waits for 500 ms without requests; only wait
+    # (bounded) for web fonts to finish loading instead of a fixed sleep
+    try:
+        await page.wait_for_function(
+            "document.fonts.status === 'loaded'", timeout=FONT_WAIT_TIMEOUT_MS
+        )
+    except PlaywrightTimeoutError:
+        pass  # Capture anyway with whatever fonts have loaded
+    image = await page.screenshot(**options)
+    # Write off the event loop so other pages keep rendering
+    await asyncio.to_thread(dest.write_bytes, image)
+    return dest
+
 
-                filename = f"screenshot-{width}x{height}.png"
-                dest = output_dir / filename
-                page.screenshot(path=str(dest), full_page=True)
-                paths.append(dest)
-                context.close()
-            browser.close()
-    return paths
+@functools.lru_cache(maxsize=1)
+def _find_lighthouse() -> str | None:
+    """Locate the Lighthouse CLI, looked up once per process."""
+    return shutil.which("lighthouse")
 
 
+@functools.lru_cache(maxsize=1)
 def _find_chrome() -> str | None:
     """Locate a Chrome/Chromium binary for Lighthouse.
 
     Checks the system PATH first, then falls back to the Playwright-managed
-    Chromium installation.
+    Chromium installation. The result is cached for the process lifetime.
     """
     for name in ("google-chrome-stable", "chromium", "chromium-browser", "chrome"):
         path = shutil.which(name)
@@ -143,12 +247,37 @@ def _find_chrome() -> str | None:
     return None
 
 
-def run_lighthouse(url: str, output_dir: Path, ignore_ssl: bool = False) -> Path | None:
+def run_lighthouse(
+    url: str, output_dir: Path, ignore_ssl: bool = False, throttling: bool = True
+) -> Path | None:
     """Run Lighthouse CLI and save the JSON report.
 
+    Lighthouse is told to give up on page load after 90s so it normally
+    exits on its own; if it still runs past ``LIGHTHOUSE_TIMEOUT_S``, or the
+    wait is interrupted, its whole process group, including the Chrome it
+    launched, is killed. With
+    *throttling* set to False the simulated CPU/network throttling is
+    skipped, which makes the audit much faster but the performance score
+    less comparable.
+
     Returns the report path, or ``None`` if lighthouse is not installed.
     """
-    lighthouse_bin = shutil.which("lighthouse")
+    started = _start_lighthouse(url, output_dir, ignore_ssl, throttling)
+    if started is None:
+        return None
+    proc, report_path = started
+    return _wait_lighthouse(proc, report_path, time.monotonic() + LIGHTHOUSE_TIMEOUT_S)
+
+
+def _start_lighthouse(
+    url: str, output_dir: Path, ignore_ssl: bool, throttling: bool
+) -> tuple[subprocess.Popen[bytes], Path] | None:
+    """Start Lighthouse in the background, see :func:`run_lighthouse`.
+
+    Returns the process and the path its report will be written to, or
+    ``None`` if lighthouse or Chrome is not installed.
+    """
+    lighthouse_bin = _find_lighthouse()
     if lighthouse_bin is None:
         print("Warning: lighthouse not found in PATH, skipping audit.")
         return None
@@ -173,19 +302,44 @@ def run_lighthouse(url: str, output_dir: Path, ignore_ssl: bool = False) -> Path
         "--output=json",
         f"--output-path={report_path}",
         f"--chrome-flags={chrome_flags}",
-        "--only-categories=performance,accessibility,best-practices,seo",
+        f"--only-categories={','.join(LIGHTHOUSE_CATEGORIES)}",
         "--quiet",
+        "--max-wait-for-load=90000",
     ]
+    if not throttling:
+        cmd.append("--throttling-method=provided")
     try:
-        subprocess.run(cmd, check=True, timeout=120, env=env)
+        # A new session puts Lighthouse and its Chrome in one process group
+        proc = subprocess.Popen(cmd, env=env, start_new_session=True)
     except FileNotFoundError:
         print("Warning: lighthouse not found, skipping audit.")
         return None
+    return proc, report_path
+
+
+def _wait_lighthouse(
+    proc: subprocess.Popen[bytes], report_path: Path, deadline: float
+) -> Path | None:
+    """Wait until *deadline* (``time.monotonic()``) for a started run.
+
+    The process group is killed if the deadline passes or the wait is
+    interrupted, e.g. by Ctrl-C.
+    """
+    try:
+        proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
     except subprocess.TimeoutExpired:
-        print("Warning: lighthouse timed out after 120s, skipping audit.")
+        _kill_process_group(proc)
+        print(
+            f"Warning: lighthouse timed out after {LIGHTHOUSE_TIMEOUT_S}s, "
+            "skipping audit."
+        )
         return None
-    except subprocess.CalledProcessError as exc:
-        print(f"Warning: lighthouse exited with code {exc.returncode}.")
+    except BaseException:
+        # e.g. KeyboardInterrupt, which does not reach the detached session
+        _kill_process_group(proc)
+        raise
+    if proc.returncode != 0:
+        print(f"Warning: lighthouse exited with code {proc.returncode}.")
         return None
 
     if report_path.exists():
@@ -193,12 +347,48 @@ def run_lighthouse(url: str, output_dir: Path, ignore_ssl: bool = False) -> Path
     return None
 
 
+def _kill_process_group(proc: subprocess.Popen[bytes]) -> None:
+    """Kill *proc* and, where supported, every process in its group."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        proc.kill()
+    proc.wait()
+
+
+def _read_categories(report_path: Path) -> dict[str, Any]:
+    """Read the ``categories`` object from a Lighthouse JSON report.
+
+    When ijson is installed the report is streamed and parsing stops once
+    all of ``LIGHTHOUSE_CATEGORIES`` are seen, so the large ``audits``
+    section never has to be held in memory.
+    """
+    try:
+        import ijson  # type: ignore
+    except ImportError:
+        # Let the json module read the file itself rather than building
+        # an intermediate str of the whole report
+        with report_path.open("rb") as f:
+            data = json.load(f)
+        return dict(data.get("categories", {}))
+
+    categories: dict[str, Any] = {}
+    with report_path.open("rb") as f:
+        for key, value in ijson.kvitems(f, "categories", use_float=True):
+            categories[key] = value
+            if all(k in categories for k in LIGHTHOUSE_CATEGORIES):
+                break
+    return categories
+
+
 def _lighthouse_summary(report_path: Path) -> str:
     """Extract category scores from a Lighthouse JSON report."""
-    data = json.loads(report_path.read_text())
-    categories = data.get("categories", {})
+    categories = _read_categories(report_path)
     lines: list[str] = []
-    for key in ("performance", "accessibility", "best-practices", "seo"):
+    for key in LIGHTHOUSE_CATEGORIES:
         cat = categories.get(key)
         if cat:
             score = cat.get("score")
@@ -241,6 +431,11 @@ def main() -> None:
     """CLI entry point for ui-review-capture."""
     parser = argparse.ArgumentParser(
         description="Capture screenshots and run Lighthouse for UI review.",
+        epilog=(
+            "Lighthouse runs while the screenshot pages load in parallel, so "
+            "its performance score is measured under that extra load. Use "
+            "--no-lighthouse and run Lighthouse on its own for a clean score."
+        ),
     )
     parser.add_argument("url", help="URL to capture")
     parser.add_argument(
@@ -283,6 +478,17 @@ def main() -> None:
         action="store_true",
         help="Skip the Lighthouse audit",
     )
+    parser.add_argument(
+        "--no-throttling",
+        action="store_true",
+        help="Run Lighthouse without simulated throttling (faster, less comparable)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["png", "jpeg"],
+        default="png",
+        help="Screenshot image format (default: png)",
+    )
     args = parser.parse_args()
 
     try:
@@ -328,26 +534,44 @@ def _run(args: argparse.Namespace) -> None:
 
     print(f"Output directory: {output_dir}")
 
+    # Lighthouse runs its own Chrome in a subprocess; start it now so it
+    # overlaps with the screenshots below
+    lighthouse_run: tuple[subprocess.Popen[bytes], Path] | None = None
+    if not args.no_lighthouse:
+        print("Running Lighthouse audit...")
+        lighthouse_run = _start_lighthouse(
+            args.url,
+            output_dir,
+            ignore_ssl=args.ignore_ssl,
+            throttling=not args.no_throttling,
+        )
+    lighthouse_deadline = time.monotonic() + LIGHTHOUSE_TIMEOUT_S
+
     # Screenshots
     print(f"Capturing screenshots at {len(viewports)} viewport(s)...")
-    screenshot_paths = capture_screenshots(
-        args.url,
-        viewports,
-        output_dir,
-        browser_type=args.browser,
-        ignore_ssl=args.ignore_ssl,
-        profile_dir=args.profile,
-    )
+    try:
+        screenshot_paths = capture_screenshots(
+            args.url,
+            viewports,
+            output_dir,
+            browser_type=args.browser,
+            ignore_ssl=args.ignore_ssl,
+            profile_dir=args.profile,
+            image_type=args.format,
+        )
+    except BaseException:
+        # Lighthouse runs in its own session, out of reach of Ctrl-C, so
+        # stop it here on any error or interrupt instead of orphaning it
+        if lighthouse_run is not None:
+            _kill_process_group(lighthouse_run[0])
+        raise
     for p in screenshot_paths:
         print(f"  Saved {p.name}")
 
     # Lighthouse
     lighthouse_path: Path | None = None
-    if not args.no_lighthouse:
-        print("Running Lighthouse audit...")
-        lighthouse_path = run_lighthouse(
-            args.url, output_dir, ignore_ssl=args.ignore_ssl
-        )
+    if lighthouse_run is not None:
+        lighthouse_path = _wait_lighthouse(*lighthouse_run, lighthouse_deadline)
         if lighthouse_path:
             print(f"  Saved {lighthouse_path.name}")
 
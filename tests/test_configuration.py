@@ -0,0 +1,98 @@
+import configparser
+import weakref
+from pathlib import Path
+
+import pytest
+
+from python_support.configuration import MyConfig, _parse_ini
+
+SAMPLES = {
+    "defaults_and_interpolation": """\
+[DEFAULT]
+base = /srv
+Home: %(base)s/home
+
+[Paths]
+data = %(home)s/data
+percent = 100%%
+""",
+    "continuations": """\
+[sec]
+multi = first
+    second
+
+    after blank
+  third
+# comment inside a value
+    fourth
+trailing = value
+
+
+[other]
+key = v
+""",
+    "indented_keys": """\
+[sec]
+    a = 1
+    b = 2
+        continued
+[next]
+  c: 3
+""",
+    "delimiters_and_comments": """\
+; leading comment
+[sec] ; note
+url = http://host:80/a=b
+Key2 :  spaced value
+empty =
+inline = kept ; not a comment
+""",
+}
+
+
+def _configparser_attrs(path: Path) -> dict[str, str]:
+    config = configparser.ConfigParser()
+    config.read(path)
+    return {
+        f"{section.lower()}_{key}": value
+        for section in config.sections()
+        for key, value in config.items(section)
+    }
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_parse_ini_matches_configparser(tmp_path: Path, name: str) -> None:
+    path = tmp_path / f"{name}.ini"
+    path.write_text(SAMPLES[name])
+    assert _parse_ini(str(path)) == _configparser_attrs(path)
+
+
+def test_my_config_attributes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "config.ini"
+    path.write_text(SAMPLES["indented_keys"])
+    monkeypatch.setenv("PYTHON_SUPPORT_TEST_CONFIG", str(path))
+    config = MyConfig("PYTHON_SUPPORT_TEST_CONFIG")
+    assert config.sec_a == "1"
+    assert config.next_c == "3"
+    with pytest.raises(AttributeError):
+        config.sec_missing
+
+
+@pytest.mark.parametrize("kind", ["missing", "directory"])
+def test_my_config_unreadable_file_is_empty(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kind: str
+) -> None:
+    path = tmp_path / "config.ini"
+    if kind == "directory":
+        path.mkdir()
+    monkeypatch.setenv("PYTHON_SUPPORT_TEST_CONFIG", str(path))
+    config = MyConfig("PYTHON_SUPPORT_TEST_CONFIG")
+    assert vars(config) == {}
+
+
+def test_my_config_supports_weakref(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PYTHON_SUPPORT_TEST_CONFIG", str(tmp_path / "missing.ini"))
+    config = MyConfig("PYTHON_SUPPORT_TEST_CONFIG")
+    assert weakref.ref(config)() is config
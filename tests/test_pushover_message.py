@@ -0,0 +1,79 @@
+import http.client
+import http.server
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from python_support import pushover_message
+from python_support.pushover_message import PushoverMessage
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    mode = "ok"
+    bodies: list[bytes] = []
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        self.bodies.append(self.rfile.read(length))
+        self.send_response(200)
+        if self.mode == "truncate":
+            # Promise more body than is sent, then hang up
+            self.send_header("Content-Length", "10")
+            self.end_headers()
+            self.wfile.write(b"{}")
+            self.close_connection = True
+            return
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+        if self.mode == "idle_close":
+            # Close the keep-alive connection without telling the client
+            self.close_connection = True
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[_Handler]]:
+    _Handler.mode = "ok"
+    _Handler.bodies = []
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    port = srv.server_address[1]
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        pushover_message.http.client,
+        "HTTPSConnection",
+        lambda host: http.client.HTTPConnection("127.0.0.1", port),
+    )
+    yield _Handler
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_send_encodes_form_body(server: type[_Handler]) -> None:
+    PushoverMessage("tok", "us&r").send("hello world")
+    assert server.bodies == [b"token=tok&user=us%26r&message=hello+world"]
+
+
+def test_send_retries_once_on_stale_connection(server: type[_Handler]) -> None:
+    pushover = PushoverMessage("tok", "user")
+    server.mode = "idle_close"
+    pushover.send("first")
+    server.mode = "ok"
+    pushover.send("second")
+    assert server.bodies == [
+        b"token=tok&user=user&message=first",
+        b"token=tok&user=user&message=second",
+    ]
+
+
+def test_send_does_not_resend_after_response(server: type[_Handler]) -> None:
+    pushover = PushoverMessage("tok", "user")
+    pushover.send("first")
+    server.mode = "truncate"
+    with pytest.raises(http.client.IncompleteRead):
+        pushover.send("second")
+    assert server.bodies.count(b"token=tok&user=user&message=second") == 1